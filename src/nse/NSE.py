@@ -1,13 +1,44 @@
-import pickle
-import zlib
+import heapq
+import json
+import os
+import re
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from hashlib import blake2b
+from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
-from zipfile import ZipFile
+from struct import unpack_from
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Literal, Optional, Union
+from urllib.parse import urlsplit
+from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile, ZipInfo
 
-from mthrottle import Throttle
 from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar, create_cookie
 from requests.exceptions import ReadTimeout
+from urllib3.util.retry import Retry
+
+try:
+    # orjson is an optional, faster drop-in for decoding large JSON payloads
+    from orjson import loads as jsonLoads
+except ModuleNotFoundError:
+    from json import loads as jsonLoads
+
+try:
+    # zlib-ng and isal are optional, faster drop-ins for Deflate decompression
+    from zlib_ng import zlib_ng as zlib
+except ModuleNotFoundError:
+    try:
+        from isal import isal_zlib as zlib
+    except ModuleNotFoundError:
+        import zlib
 
 throttleConfig = {
     "default": {
@@ -15,7 +46,65 @@ throttleConfig = {
     },
 }
 
-th = Throttle(throttleConfig, 10)
+
+class HostThrottle:
+    """Allow at most ``rps`` requests to a host in any one second window.
+
+    Timestamps of the last ``rps`` requests are kept and a request only
+    sleeps if the oldest of them is less than a second old. Safe to share
+    between threads."""
+
+    def __init__(self, rps: int):
+        self.stamps = deque(maxlen=rps)
+        self.lock = Lock()
+
+    def check(self):
+        with self.lock:
+            if len(self.stamps) == self.stamps.maxlen:
+                wait = 1 - (time.monotonic() - self.stamps[0])
+
+                if wait > 0:
+                    time.sleep(wait)
+
+            self.stamps.append(time.monotonic())
+
+
+hostThrottles: Dict[str, HostThrottle] = {}
+hostThrottlesLock = Lock()
+
+
+def throttle(url: str):
+    """Block until a request to the host of ``url`` is within rate limits"""
+
+    host = urlsplit(url).netloc
+
+    with hostThrottlesLock:
+        if host not in hostThrottles:
+            hostThrottles[host] = HostThrottle(throttleConfig["default"]["rps"])
+
+        th = hostThrottles[host]
+
+    th.check()
+
+
+pChange = itemgetter("pChange")
+
+# Default date ranges for listPastIPO and circulars
+pastIpoLookback = timedelta(90)
+circularsLookback = timedelta(7)
+
+# Month abbreviations used in NSE dates (dd-Mon-yyyy)
+monthNames = tuple("Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split())
+
+months = {m: i for i, m in enumerate(monthNames, 1)}
+
+# Symbol and current month lot size from each row of fo_mktlots.csv. Header
+# and blank rows do not match. Fields never span lines, so the whole file is
+# matched in a single scan
+lotRegex = re.compile(
+    rb"^[^,\n]*,[ \t]*([^,\n]*?)[ \t]*,[^,\n]*,[ \t]*(\d+)[ \t\r]*(?:,|$)",
+    re.M,
+)
 
 
 class NSE:
@@ -27,6 +116,10 @@ class NSE:
 
     :param download_folder: A folder/dir to save downloaded files and cookie files
     :type download_folder: pathlib.Path or str
+    :param chunk_size: Size in bytes of each read when downloading reports. Default 256 KB. Reports no larger than this are read in a single request body read
+    :type chunk_size: int
+    :param share_session: If ``True``, reuse the cookie-warmed ``requests`` session of other ``NSE`` instances with the same ``download_folder``. Default ``False``
+    :type share_session: bool
     :raise ValueError: if ``download_folder`` is not a folder/dir
     """
 
@@ -44,66 +137,191 @@ class NSE:
     FNO_FINNIFTY = "finnifty"
     FNO_IT = "niftyit"
 
-    __optionIndex = ("banknifty", "nifty", "finnifty", "niftyit")
-    base_url = "https://www.nseindia.com/api"
-    archive_url = "https://nsearchives.nseindia.com"
-
-    def __init__(self, download_folder: Union[str, Path]):
-        """Initialise NSE"""
-
-        uAgent = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/118.0"
+    __optionIndex = frozenset((FNO_BANK, FNO_NIFTY, FNO_FINNIFTY, FNO_IT))
 
-        headers = {
-            "User-Agent": uAgent,
+    __headers = MappingProxyType(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/118.0",
             "Accept": "*/*",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
             "Referer": "https://www.nseindia.com/get-quotes/equity?symbol=HDFCBANK",
+            "Connection": "keep-alive",
+        }
+    )
+
+    # Report URL templates formatted with (archive_url, date, 2 digit year).
+    # Date fields are read directly from the date object instead of going
+    # through strftime
+    __reportUrls = MappingProxyType(
+        {
+            "equity": "{0}/content/cm/BhavCopy_NSE_CM_0_0_0_{1.year}{1.month:02d}{1.day:02d}_F_0000.csv.zip",
+            "delivery": "{0}/products/content/sec_bhavdata_full_{1.day:02d}{1.month:02d}{1.year}.csv",
+            "indices": "{0}/content/indices/ind_close_all_{1.day:02d}{1.month:02d}{1.year}.csv",
+            "fno": "{0}/content/fo/BhavCopy_NSE_FO_0_0_0_{1.year}{1.month:02d}{1.day:02d}_F_0000.csv.zip",
+            "priceband": "{0}/content/equities/sec_list_{1.day:02d}{1.month:02d}{1.year}.csv",
+            "pr": "{0}/archives/equities/bhavcopy/pr/PR{1.day:02d}{1.month:02d}{2:02d}.zip",
+            "cm_mii": "{0}/content/cm/NSE_CM_security_{1.day:02d}{1.month:02d}{1.year}.csv.gz",
         }
+    )
+
+    __bhavcopyKinds = frozenset(("equity", "delivery", "indices", "fno"))
+
+    base_url = "https://www.nseindia.com/api"
+    archive_url = "https://nsearchives.nseindia.com"
+
+    # Seconds after which saved cookies are refreshed, regardless of expiry
+    __cookieMaxAge = 3300
+
+    # Cookie-warmed sessions shared by instances using the same folder and
+    # share_session=True
+    __sessions: Dict[Path, Session] = {}
+
+    # Serialises cookie refreshes made from __req by concurrent threads
+    __cookieLock = Lock()
+
+    def __init__(
+        self,
+        download_folder: Union[str, Path],
+        chunk_size: int = 262144,
+        share_session: bool = False,
+    ):
+        """Initialise NSE"""
 
         self.dir = NSE.__getPath(download_folder, isFolder=True)
 
-        self.cookie_path = self.dir / "nse_cookies.pkl"
+        self.chunk_size = chunk_size
+
+        self.cookie_path = self.dir / "nse_cookies.json"
+
+        self.cache_dir = self.dir / "nse_cache"
+
+        # folder argument -> checked download folder
+        self.__folders: Dict[Union[str, Path], Path] = {}
+
+        # (url, params) -> (expiry timestamp, response body)
+        self.__cache: Dict[tuple, tuple] = {}
+
+        self.__shared = share_session
+
+        # Cookie expiry is re-checked at most once a minute from __req
+        self.__cookiesCheckedAt = time.monotonic()
 
-        self.session = Session()
-        self.session.headers.update(headers)
-        self.session.cookies.update(self.__getCookies())
+        key = self.dir.resolve()
+
+        if share_session and key in NSE.__sessions:
+            self.session = NSE.__sessions[key]
+        else:
+            self.session = self.__newSession()
+            self.session.cookies.update(self.__getCookies())
+
+            if share_session:
+                NSE.__sessions[key] = self.session
+
+        self.__cookieExpiry = NSE.__earliestExpiry(self.session.cookies)
+
+    def __newSession(self) -> Session:
+        # Session defaults to requests' Accept-Encoding, which includes br
+        # and zstd when urllib3 can decode them
+        session = Session()
+        session.headers.update(NSE.__headers)
+
+        # Reuse pooled keep-alive connections across requests and retry
+        # transient gateway errors. Read timeouts are not retried and
+        # continue to raise TimeoutError from NSE.__req
+        #
+        # Retries are made inside session.get and bypass the host throttle.
+        # 503 is NSE's throttling or bot check signal, so it is not retried
+        # and raises ConnectionError from NSE.__req instead
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                read=False,
+                backoff_factor=0.3,
+                status_forcelist=(502, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            ),
+        )
+
+        # Cover every NSE host, including www1 and the archive hosts
+        session.mount("https://", adapter)
+
+        return session
 
     def __setCookies(self):
         r = self.__req("https://www.nseindia.com/option-chain", timeout=10)
 
         cookies = r.cookies
 
-        self.cookie_path.write_bytes(pickle.dumps(cookies))
+        payload = {
+            # Earliest cookie expiry, so freshness is a single comparison
+            "expires": NSE.__earliestExpiry(cookies),
+            "cookies": [
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "expires": c.expires,
+                    "domain": c.domain,
+                    "path": c.path,
+                }
+                for c in cookies
+            ],
+        }
+
+        # Swap in a complete file, so an interrupted write never leaves a
+        # corrupt cookie file behind
+        NSE.__writeFile(self.cookie_path, json.dumps(payload).encode())
 
         return cookies
 
     def __getCookies(self):
 
-        if self.cookie_path.exists():
-            cookies = pickle.loads(self.cookie_path.read_bytes())
+        try:
+            age = time.time() - self.cookie_path.stat().st_mtime
+        except FileNotFoundError:
+            age = NSE.__cookieMaxAge
 
-            if self.__hasCookiesExpired(cookies):
-                cookies = self.__setCookies()
+        # Files older than the shortest NSE cookie lifetime are refreshed
+        # without being read. This also bounds the life of session cookies
+        if age < NSE.__cookieMaxAge:
+            try:
+                payload = jsonLoads(self.cookie_path.read_bytes())
+                expires = payload["expires"]
+            except (ValueError, KeyError, TypeError):
+                # Corrupt or outdated cookie file
+                return self.__setCookies()
 
-            return cookies
+            if self.__hasCookiesExpired(expires):
+                return self.__setCookies()
+
+            jar = RequestsCookieJar()
+
+            for c in payload["cookies"]:
+                jar.set_cookie(create_cookie(**c))
+
+            return jar
 
         return self.__setCookies()
 
     @staticmethod
-    def __hasCookiesExpired(cookies):
-        for cookie in cookies:
-            if cookie.is_expired():
-                return True
+    def __earliestExpiry(cookies) -> Optional[float]:
+        return min((c.expires for c in cookies if c.expires), default=None)
 
-        return False
+    @staticmethod
+    def __hasCookiesExpired(expires: Optional[float]) -> bool:
+        # Refresh a little early, so cookies do not expire mid request
+        return expires is not None and expires - 5 <= time.time()
 
     def __enter__(self):
         return self
 
-    def __exit__(self, *_):
-        self.session.close()
-        self.cookie_path.unlink(missing_ok=True)
+    def __exit__(self, exc_type, *_):
+        # Keep a shared session open for the next instance using this
+        # folder, unless the block failed
+        if exc_type is not None or not self.__shared:
+            self.exit()
 
         return False
 
@@ -120,30 +338,37 @@ class NSE:
 
         return path
 
-    @staticmethod
-    def __unzip(file: Path, folder: Path):
-        if file.suffix == ".zip":
-            with ZipFile(file) as zip:
-                filepath = zip.extract(member=zip.namelist()[0], path=folder)
-        elif file.suffix == ".gz":
-            with open(file, "rb") as f_in:
-                with open(file.stem, "wb") as f_out:
-                    f_out.write(zlib.decompress(f_in.read(), wbits=31))
-
-            filepath = file.stem
-        else:
-            raise ValueError("Unknown file format")
+    def __getFolder(self, folder: Union[str, Path, None]) -> Path:
+        """Return the download folder for ``folder``, or ``download_folder``
+        if not specified.
+
+        Folders are checked and created on first use only, so repeated
+        downloads to the same folder skip the filesystem calls"""
 
-        file.unlink()
-        return Path(filepath)
+        if not folder:
+            return self.dir
 
-    def __download(self, url: str, folder: Path):
+        path = self.__folders.get(folder)
+
+        if path is None:
+            path = NSE.__getPath(folder, isFolder=True)
+            self.__folders[folder] = path
+
+        return path
+
+    def __download(self, url: str, folder: Path, extract: bool = False):
         """Download a large file in chunks from the given url.
-        Returns pathlib.Path object of the downloaded file"""
+        Returns pathlib.Path object of the downloaded file
+
+        If ``extract`` is True, ``url`` must point to a zip or gzip file.
+        Zip files are extracted from memory and gzip files are decompressed
+        as they stream in. Only the extracted file is written to disk.
+        Zip files holding several files are extracted to a folder named
+        after the zip file and the folder path is returned."""
 
         fname = folder / url.split("/")[-1]
 
-        th.check()
+        throttle(url)
 
         with self.session.get(url, stream=True, timeout=15) as r:
 
@@ -154,19 +379,133 @@ class NSE:
                     "NSE file is unavailable or not yet updated."
                 )
 
+            if extract and fname.suffix == ".zip":
+                data = r.content
+
+                with ZipFile(BytesIO(data)) as zip:
+                    members = [m for m in zip.infolist() if not m.is_dir()]
+
+                    if len(members) == 1:
+                        # Most NSE archives hold a single report. Inflate it
+                        # in one call and write it out in one go
+                        member = members[0]
+                        fname = folder / Path(member.filename).name
+                        fname.write_bytes(NSE.__readMember(zip, member, data))
+
+                        return fname
+
+                # Collections like the PR bhavcopy hold several reports
+                return NSE.__extractAll(data, fname.with_suffix(""))
+
+            length = r.headers.get("content-length")
+
+            if length and int(length) <= self.chunk_size:
+                # Fits in a single read, skip the copy loop
+                body = r.content
+
+                if extract:
+                    fname = fname.with_suffix("")
+                    body = zlib.decompress(body, wbits=31)
+
+                fname.write_bytes(body)
+
+                return fname
+
+            # Copy socket reads straight to file, decoding any gzip or
+            # deflate Content-Encoding on the way
+            r.raw.decode_content = True
+
+            if extract:
+                fname = fname.with_suffix("")
+                inflater = zlib.decompressobj(wbits=31)
+
+                with fname.open(mode="wb") as f:
+                    for chunk in iter(lambda: r.raw.read(self.chunk_size), b""):
+                        f.write(inflater.decompress(chunk))
+
+                    f.write(inflater.flush())
+
+                return fname
+
             with fname.open(mode="wb") as f:
-                for chunk in r.iter_content(chunk_size=1000000):
-                    f.write(chunk)
+                shutil.copyfileobj(r.raw, f, length=self.chunk_size)
 
         return fname
 
-    def __req(self, url, params=None, timeout=10):
+    @staticmethod
+    def __readMember(zip: ZipFile, member: ZipInfo, data: bytes) -> bytes:
+        """Return the uncompressed contents of zip ``member``.
+
+        Deflated members are inflated directly from the archive bytes
+        ``data`` using ``zlib``, which may be one of the faster optional
+        drop-ins. Others are read through ``ZipFile``"""
+
+        if member.compress_type != ZIP_DEFLATED:
+            return zip.read(member)
+
+        # Member data follows the 30 byte local file header, the file name
+        # and the extra field
+        nameLen, extraLen = unpack_from("<HH", data, member.header_offset + 26)
+        start = member.header_offset + 30 + nameLen + extraLen
+
+        content = zlib.decompress(
+            data[start : start + member.compress_size], wbits=-15
+        )
+
+        if zlib.crc32(content) != member.CRC:
+            raise BadZipFile(f"Bad CRC-32 for file {member.filename!r}")
+
+        return content
+
+    @staticmethod
+    def __extractAll(data: bytes, folder: Path) -> Path:
+        """Extract every file in the zip archive ``data`` to ``folder`` and
+        return ``folder``.
+
+        Members are inflated on a thread pool. zlib releases the GIL while
+        decompressing, so independent members are extracted in parallel"""
+
+        folder.mkdir(exist_ok=True)
+
+        with ZipFile(BytesIO(data)) as zip:
+
+            def extract(member: ZipInfo):
+                content = NSE.__readMember(zip, member, data)
+                (folder / Path(member.filename).name).write_bytes(content)
+
+            members = [m for m in zip.infolist() if not m.is_dir()]
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # Consume the results to raise any extraction error
+                list(executor.map(extract, members))
+
+        return folder
+
+    def __req(self, url, params=None, timeout=10, headers=None):
         """Make a http request"""
 
-        th.check()
+        if time.monotonic() - self.__cookiesCheckedAt > 60:
+            with NSE.__cookieLock:
+                now = time.monotonic()
+
+                # Another thread may have checked while this one waited
+                if now - self.__cookiesCheckedAt > 60:
+                    # Set before refreshing, as __setCookies requests
+                    # through here
+                    self.__cookiesCheckedAt = now
+
+                    if NSE.__hasCookiesExpired(self.__cookieExpiry):
+                        self.session.cookies.update(self.__setCookies())
+                        self.__cookieExpiry = NSE.__earliestExpiry(
+                            self.session.cookies
+                        )
+
+        throttle(url)
 
         try:
-            r = self.session.get(url, params=params, timeout=timeout)
+            r = self.session.get(
+                url, params=params, headers=headers, timeout=timeout
+            )
         except ReadTimeout as e:
             raise TimeoutError(repr(e))
 
@@ -175,16 +514,243 @@ class NSE:
 
         return r
 
+    def __cachedReq(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        ttl: float = 2,
+        persist: bool = False,
+    ) -> bytes:
+        """Make a http request and return the response body.
+
+        Returns the body of an identical request made in the last ``ttl``
+        seconds if available. If ``persist`` is True, the body is also saved
+        under ``download_folder`` and reused across script runs. Once stale,
+        it is revalidated with a conditional request, using the
+        ``Last-Modified`` and ``ETag`` headers saved with it"""
+
+        key = (url, tuple(sorted(params.items())) if params else None)
+
+        cached = self.__cache.get(key)
+
+        if cached:
+            if cached[0] > time.monotonic():
+                return cached[1]
+
+            self.__cache.pop(key, None)
+
+        headers = None
+
+        if persist:
+            file = self.cache_dir / blake2b(
+                repr(key).encode(), digest_size=16
+            ).hexdigest()
+
+            try:
+                mtime = file.stat().st_mtime
+                data = file.read_bytes()
+            except FileNotFoundError:
+                mtime = None
+
+            if mtime is not None:
+                # Saved as the response validators in JSON, a newline and
+                # the body
+                line, _, content = data.partition(b"\n")
+
+                try:
+                    validators = NSE.__parseValidators(line)
+                except ValueError:
+                    # Corrupt or outdated cache file
+                    file.unlink(missing_ok=True)
+                    mtime = None
+
+            if mtime is not None:
+                age = time.time() - mtime
+
+                if age < ttl:
+                    self.__cacheSet(key, ttl - age, content)
+                    return content
+
+                # Only resend the body if it changed since it was saved.
+                # The server's own validators are sent back, so the local
+                # clock plays no part
+                headers = validators or None
+
+        r = self.__req(url, params=params, headers=headers)
+
+        if persist and r.status_code == 304:
+            # Still current, keep the saved copy for another ttl
+            os.utime(file)
+            self.__cacheSet(key, ttl, content)
+            return content
+
+        content = r.content
+
+        contentType = r.headers.get("content-type")
+
+        # An html body is NSE's error or bot check page. Do not cache it, so
+        # the next call retries instead of reusing it for the full ttl
+        if contentType and "text/html" in contentType:
+            return content
+
+        self.__cacheSet(key, ttl, content)
+
+        if persist:
+            validators = {}
+
+            if "last-modified" in r.headers:
+                validators["If-Modified-Since"] = r.headers["last-modified"]
+
+            if "etag" in r.headers:
+                validators["If-None-Match"] = r.headers["etag"]
+
+            self.cache_dir.mkdir(exist_ok=True)
+
+            NSE.__writeFile(
+                file, json.dumps(validators).encode() + b"\n" + content
+            )
+
+        return content
+
+    @staticmethod
+    def __parseValidators(line: bytes) -> Dict[str, str]:
+        """Return the conditional request headers saved in ``line`` of a
+        cache file.
+
+        Raises ValueError if ``line`` does not hold them"""
+
+        validators = jsonLoads(line)
+
+        if not isinstance(validators, dict) or not all(
+            k in ("If-Modified-Since", "If-None-Match") and isinstance(v, str)
+            for k, v in validators.items()
+        ):
+            raise ValueError("Invalid cache validators")
+
+        return validators
+
+    def __cacheSet(self, key: tuple, ttl: float, content: bytes):
+        """Cache ``content`` under ``key`` for ``ttl`` seconds.
+
+        Expired entries are dropped first, so polling many symbols does not
+        keep every response body for the life of the instance"""
+
+        now = time.monotonic()
+
+        # Copy the items, as other threads may add entries meanwhile
+        for k, (expiry, _) in list(self.__cache.items()):
+            if expiry <= now:
+                self.__cache.pop(k, None)
+
+        self.__cache[key] = (now + ttl, content)
+
+    @staticmethod
+    def __writeFile(file: Path, content: bytes):
+        """Write ``content`` to a uniquely named temporary file and swap it
+        in as ``file``.
+
+        Readers never see a partial write and concurrent writers, in other
+        threads or processes, do not clash over the temporary file"""
+
+        with NamedTemporaryFile(
+            dir=file.parent, prefix=file.name, suffix=".tmp", delete=False
+        ) as f:
+            f.write(content)
+
+        try:
+            os.replace(f.name, file)
+        except OSError:
+            os.unlink(f.name)
+            raise
+
+    @staticmethod
+    def __dmy(date: datetime, sep: str = "") -> str:
+        """Format ``date`` as day, month and year (``ddmmyyyy``) joined by
+        ``sep``, without going through strftime"""
+
+        return f"{date.day:02d}{sep}{date.month:02d}{sep}{date.year}"
+
+    @staticmethod
+    def __dateRange(from_date: datetime, to_date: datetime) -> Dict[str, str]:
+        """Validate the date range and return it as ``from_date`` and
+        ``to_date`` query params"""
+
+        if from_date > to_date:
+            raise ValueError("'from_date' cannot be greater than 'to_date'")
+
+        return {
+            "from_date": NSE.__dmy(from_date, "-"),
+            "to_date": NSE.__dmy(to_date, "-"),
+        }
+
+    @staticmethod
+    def __dMonY(date: datetime) -> str:
+        """Format ``date`` as ``dd-Mon-yyyy``, the format of NSE expiry dates,
+        without going through strftime"""
+
+        return f"{date.day:02d}-{monthNames[date.month - 1]}-{date.year}"
+
+    def __reportUrl(self, kind: str, date: datetime) -> str:
+        """Return the archive url of the report ``kind`` for ``date``"""
+
+        return self.__reportUrls[kind].format(
+            self.archive_url, date, date.year % 100
+        )
+
+    def __fetchReport(
+        self,
+        kind: str,
+        date: datetime,
+        folder: Union[str, Path, None],
+        extract: bool = True,
+    ) -> Path:
+        """Download the report ``kind`` for ``date``, extracting zip and gzip
+        files if ``extract`` is True. Returns pathlib.Path object of the saved
+        file, or folder for zip files holding several reports"""
+
+        folder = self.__getFolder(folder)
+
+        url = self.__reportUrl(kind, date)
+
+        extract = extract and url.endswith((".zip", ".gz"))
+
+        file = self.__download(url, folder, extract=extract)
+
+        if not file.exists():
+            raise FileNotFoundError(f"Failed to download file: {file.name}")
+
+        return file
+
     def exit(self):
         """Close the ``requests`` session.
 
         *Use at the end of script or when class is no longer required.*
 
-        *Not required when using the ``with`` statement.*"""
+        *Not required when using the ``with`` statement.* With ``share_session=True``, the ``with`` statement keeps the session open for reuse by other ``NSE`` instances with the same ``download_folder``. See ``NSE.close_all``"""
+
+        if self.__shared:
+            NSE.__sessions.pop(self.dir.resolve(), None)
 
         self.session.close()
         self.cookie_path.unlink(missing_ok=True)
 
+    def clear_cache(self):
+        """Discard all cached responses, including those saved to disk."""
+
+        self.__cache.clear()
+
+        if self.cache_dir.is_dir():
+            shutil.rmtree(self.cache_dir)
+
+    @classmethod
+    def close_all(cls):
+        """Close all ``requests`` sessions shared between ``NSE`` instances.
+
+        *Use at the end of script if ``NSE`` was used with ``share_session=True`` and the ``with`` statement.*"""
+
+        while cls.__sessions:
+            cls.__sessions.popitem()[1].close()
+
     def status(self) -> List[Dict]:
         """Returns market status
 
@@ -194,7 +760,9 @@ class NSE:
         :rtype: list[dict]
         """
 
-        return self.__req(f"{self.base_url}/marketStatus").json()["marketState"]
+        return jsonLoads(
+            self.__req(f"{self.base_url}/marketStatus").content
+        )["marketState"]
 
     def equityBhavcopy(
         self, date: datetime, folder: Union[str, Path, None] = None
@@ -213,20 +781,7 @@ class NSE:
         :rtype: pathlib.Path
         """
 
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
-
-        url = "{}/content/cm/BhavCopy_NSE_CM_0_0_0_{}_F_0000.csv.zip".format(
-            self.archive_url,
-            date.strftime("%Y%m%d"),
-        )
-
-        file = self.__download(url, folder)
-
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
-
-        return NSE.__unzip(file, file.parent)
+        return self.__fetchReport("equity", date, folder)
 
     def deliveryBhavcopy(
         self, date: datetime, folder: Union[str, Path, None] = None
@@ -243,19 +798,7 @@ class NSE:
         :return: Path to saved file
         :rtype: pathlib.Path"""
 
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
-
-        url = "{}/products/content/sec_bhavdata_full_{}.csv".format(
-            self.archive_url, date.strftime("%d%m%Y")
-        )
-
-        file = self.__download(url, folder)
-
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
-
-        return file
+        return self.__fetchReport("delivery", date, folder)
 
     def indicesBhavcopy(
         self, date: datetime, folder: Union[str, Path, None] = None
@@ -273,17 +816,7 @@ class NSE:
         :return: Path to saved file
         :rtype: pathlib.Path"""
 
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
-
-        url = f"{self.archive_url}/content/indices/ind_close_all_{date:%d%m%Y}.csv"
-
-        file = self.__download(url, folder)
-
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
-
-        return file
+        return self.__fetchReport("indices", date, folder)
 
     def fnoBhavcopy(
         self, date: datetime, folder: Union[str, Path, None] = None
@@ -301,19 +834,82 @@ class NSE:
         :return: Path to saved file
         :rtype: pathlib.Path"""
 
-        dt_str = date.strftime("%Y%m%d")
+        return self.__fetchReport("fno", date, folder)
 
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
+    def bhavcopy(
+        self,
+        date: datetime,
+        which: Iterable[
+            Literal["equity", "delivery", "indices", "fno"]
+        ] = ("equity", "delivery", "indices", "fno"),
+        folder: Union[str, Path, None] = None,
+    ) -> Dict[str, Path]:
+        """Download multiple daily bhavcopy reports for specified ``date`` concurrently
+        and return the saved file paths.
+
+        Reports are downloaded in parallel over the shared ``requests`` session, with at most 3 downloads in flight to match the rate limit.
+
+        :param date: Date of bhavcopy reports to download
+        :type date: datetime.datetime
+        :param which: Reports to download. Any of ``equity``, ``delivery``, ``indices`` or ``fno``. Default all four.
+        :type which: tuple[str]
+        :param folder: Optional folder path to save files. If not specified, use ``download_folder`` specified during class initializataion.
+        :type folder: pathlib.Path or str
+        :raise ValueError: if ``folder`` is not a dir/folder or ``which`` contains an unknown report.
+        :raise FileNotFoundError: if download failed or file corrupted
+        :raise RuntimeError: if report unavailable or not yet updated.
+        :return: A dictionary with report names as keys and saved file paths as values
+        :rtype: dict[str, pathlib.Path]"""
 
-        url = f"{self.archive_url}/content/fo/BhavCopy_NSE_FO_0_0_0_{dt_str}_F_0000.csv.zip"
+        which = tuple(which)
 
-        file = self.__download(url, folder)
+        for kind in which:
+            if kind not in self.__bhavcopyKinds:
+                raise ValueError(f"Unknown bhavcopy report: {kind}")
 
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
+        # Check and create the folder once, before the downloads start
+        folder = self.__getFolder(folder)
+
+        def fetch(kind: str) -> Path:
+            return self.__fetchReport(kind, date, folder)
+
+        with ThreadPoolExecutor(
+            max_workers=throttleConfig["default"]["rps"]
+        ) as executor:
+            return dict(zip(which, executor.map(fetch, which)))
+
+    def batch_download(
+        self,
+        urls: Iterable[str],
+        folder: Union[str, Path, None] = None,
+        extract: bool = False,
+    ) -> List[Path]:
+        """Download multiple NSE files concurrently and return the saved file paths in the same order as ``urls``.
+
+        Files are downloaded in parallel over the shared ``requests`` session, with at most 3 downloads in flight to match the rate limit.
+
+        :param urls: Urls of files to download
+        :type urls: list[str]
+        :param folder: Optional folder path to save files. If not specified, use ``download_folder`` specified during class initializataion.
+        :type folder: pathlib.Path or str
+        :param extract: If ``True``, zip and gzip files are extracted and the extracted file path is returned. Zip files holding several files, like the PR bhavcopy, are extracted to a folder named after the zip file and the folder path is returned. Default ``False``
+        :type extract: bool
+        :raise ValueError: if ``folder`` is not a dir/folder
+        :raise RuntimeError: if a file is unavailable or not yet updated.
+        :return: List of paths to saved files
+        :rtype: list[pathlib.Path]"""
+
+        folder = self.__getFolder(folder)
+
+        def download(url: str) -> Path:
+            isArchive = url.endswith((".zip", ".gz"))
 
-        return NSE.__unzip(file, folder=file.parent)
+            return self.__download(url, folder, extract=extract and isArchive)
+
+        with ThreadPoolExecutor(
+            max_workers=throttleConfig["default"]["rps"]
+        ) as executor:
+            return list(executor.map(download, urls))
 
     def priceband_report(
         self, date: datetime, folder: Union[str, Path, None] = None
@@ -331,22 +927,13 @@ class NSE:
         :return: Path to saved file
         :rtype: pathlib.Path"""
 
-        dt_str = date.strftime("%d%m%Y")
-
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
-
-        url = f"{self.archive_url}/content/equities/sec_list_{dt_str}.csv"
-
-        file = self.__download(url, folder)
-
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
-
-        return file
+        return self.__fetchReport("priceband", date, folder)
 
     def pr_bhavcopy(
-        self, date: datetime, folder: Union[str, Path, None] = None
+        self,
+        date: datetime,
+        folder: Union[str, Path, None] = None,
+        extract: bool = False,
     ) -> Path:
         """Download the daily PR Bhavcopy zip report for specified ``date``
         and return the saved zipfile path.
@@ -355,30 +942,23 @@ class NSE:
 
         It includes a `Readme.txt`, explaining the contents of each file and the file naming format.
 
+        If ``extract`` is ``True``, the reports are extracted in parallel to a folder named after the zip file and the folder path is returned. The zip file itself is not saved.
+
         :param date: Report date to download
         :type date: datetime.datetime
         :param folder: Optional folder path to save file. If not specified, use ``download_folder`` specified during class initializataion.
         :type folder: pathlib.Path or str
+        :param extract: Extract all reports from the zip file. Default ``False``
+        :type extract: bool
         :raise ValueError: if ``folder`` is not a dir/folder
         :raise FileNotFoundError: if download failed or file corrupted
         :raise RuntimeError: if report unavailable or not yet updated.
-        :return: Path to saved zip file
+        :return: Path to saved zip file or folder of extracted reports
         :rtype: pathlib.Path
         """
 
-        dt_str = date.strftime("%d%m%y")
-
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
-
-        url = f"{self.archive_url}/archives/equities/bhavcopy/pr/PR{dt_str}.zip"
-
-        file = self.__download(url, folder)
-
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
-
-        return file
+        # Reports are extracted from memory, without saving the zip file
+        return self.__fetchReport("pr", date, folder, extract=extract)
 
     def cm_mii_security_report(
         self, date: datetime, folder: Union[str, Path, None] = None
@@ -399,19 +979,7 @@ class NSE:
         :rtype: pathlib.Path
         """
 
-        dt_str = date.strftime("%d%m%Y")
-
-        folder = NSE.__getPath(folder, isFolder=True) if folder else self.dir
-
-        url = f"{self.archive_url}/content/cm/NSE_CM_security_{dt_str}.csv.gz"
-
-        file = self.__download(url, folder)
-
-        if not file.is_file():
-            file.unlink()
-            raise FileNotFoundError(f"Failed to download file: {file.name}")
-
-        return self.__unzip(file, folder=file.parent)
+        return self.__fetchReport("cm_mii", date, folder)
 
     def actions(
         self,
@@ -440,8 +1008,6 @@ class NSE:
         :return: A list of corporate actions
         :rtype: list[dict]"""
 
-        fmt = "%d-%m-%Y"
-
         params = {
             "index": segment,
         }
@@ -450,19 +1016,11 @@ class NSE:
             params["symbol"] = symbol
 
         if from_date and to_date:
-            if from_date > to_date:
-                raise ValueError("'from_date' cannot be greater than 'to_date'")
-
-            params.update(
-                {
-                    "from_date": from_date.strftime(fmt),
-                    "to_date": to_date.strftime(fmt),
-                }
-            )
+            params.update(NSE.__dateRange(from_date, to_date))
 
         url = f"{self.base_url}/corporates-corporateActions"
 
-        return self.__req(url, params=params).json()
+        return jsonLoads(self.__req(url, params=params).content)
 
     def announcements(
         self,
@@ -496,8 +1054,6 @@ class NSE:
         :return: A list of corporate actions
         :rtype: list[dict]"""
 
-        fmt = "%d-%m-%Y"
-
         params: Dict[str, Any] = {"index": index}
 
         if symbol:
@@ -507,19 +1063,11 @@ class NSE:
             params["fo_sec"] = True
 
         if from_date and to_date:
-            if from_date > to_date:
-                raise ValueError("'from_date' cannot be greater than 'to_date'")
-
-            params.update(
-                {
-                    "from_date": from_date.strftime(fmt),
-                    "to_date": to_date.strftime(fmt),
-                }
-            )
+            params.update(NSE.__dateRange(from_date, to_date))
 
         url = f"{self.base_url}/corporate-announcements"
 
-        return self.__req(url, params=params).json()
+        return jsonLoads(self.__req(url, params=params).content)
 
     def boardMeetings(
         self,
@@ -551,8 +1099,6 @@ class NSE:
         :return: A list of corporate board meetings
         :rtype: list[dict]"""
 
-        fmt = "%d-%m-%Y"
-
         params: Dict[str, Any] = {"index": index}
 
         if symbol:
@@ -562,19 +1108,11 @@ class NSE:
             params["fo_sec"] = True
 
         if from_date and to_date:
-            if from_date > to_date:
-                raise ValueError("'from_date' cannot be greater than 'to_date'")
-
-            params.update(
-                {
-                    "from_date": from_date.strftime(fmt),
-                    "to_date": to_date.strftime(fmt),
-                }
-            )
+            params.update(NSE.__dateRange(from_date, to_date))
 
         url = f"{self.base_url}/corporate-board-meetings"
 
-        return self.__req(url, params=params).json()
+        return jsonLoads(self.__req(url, params=params).content)
 
     def equityMetaInfo(self, symbol) -> Dict:
         """Meta info for equity symbols.
@@ -583,6 +1121,8 @@ class NSE:
 
         Also has info if stock is an FnO, ETF or Debt security
 
+        Responses are cached on disk for a day. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/equityMetaInfo.json>`__
 
         :param symbol: Equity symbol code
@@ -592,7 +1132,12 @@ class NSE:
 
         url = f"{self.base_url}/equity-meta-info"
 
-        return self.__req(url, params={"symbol": symbol.upper()}).json()
+        # Meta info rarely changes, keep it for a day
+        return jsonLoads(
+            self.__cachedReq(
+                url, params={"symbol": symbol.upper()}, ttl=86400, persist=True
+            )
+        )
 
     def quote(
         self,
@@ -630,7 +1175,7 @@ class NSE:
 
             params["section"] = section
 
-        return self.__req(url, params=params).json()
+        return jsonLoads(self.__cachedReq(url, params=params, ttl=2))
 
     def equityQuote(self, symbol) -> Dict[str, Union[str, float]]:
         """A convenience method that extracts date and OCHLV data from ``NSE.quote`` for given stock ``symbol``
@@ -642,8 +1187,12 @@ class NSE:
         :return: Date and OCHLV data
         :rtype: dict[str, str or float]"""
 
-        q = self.quote(symbol, type="equity")
-        v = self.quote(symbol, type="equity", section="trade_info")
+        # The two sections are independent, fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            q, v = executor.map(
+                lambda section: self.quote(symbol, section=section),
+                (None, "trade_info"),
+            )
 
         _open, minmax, close, ltp = map(
             q["priceInfo"].get,
@@ -671,11 +1220,12 @@ class NSE:
         :return: List of top gainers
         :rtype: list[dict]"""
 
-        return sorted(
-            filter(lambda dct: dct["pChange"] > 0, data["data"]),
-            key=lambda dct: dct["pChange"],
-            reverse=True,
-        )[:count]
+        gainers = (dct for dct in data["data"] if dct["pChange"] > 0)
+
+        if count is None:
+            return sorted(gainers, key=pChange, reverse=True)
+
+        return heapq.nlargest(count, gainers, key=pChange)
 
     def losers(self, data: Dict, count: Optional[int] = None) -> List[Dict]:
         """Top losers by percent change below zero.
@@ -689,10 +1239,12 @@ class NSE:
         :return: List of top losers
         :rtype: list[dict]"""
 
-        return sorted(
-            filter(lambda dct: dct["pChange"] < 0, data["data"]),
-            key=lambda dct: dct["pChange"],
-        )[:count]
+        losers = (dct for dct in data["data"] if dct["pChange"] < 0)
+
+        if count is None:
+            return sorted(losers, key=pChange)
+
+        return heapq.nsmallest(count, losers, key=pChange)
 
     def listFnoStocks(self):
         """
@@ -712,7 +1264,9 @@ class NSE:
 
         url = f"{self.base_url}/equity-stockIndices"
 
-        return self.__req(url, params={"index": "SECURITIES IN F&O"}).json()
+        return jsonLoads(
+            self.__req(url, params={"index": "SECURITIES IN F&O"}).content
+        )
 
     def listEquityStocksByIndex(self, index="NIFTY 50"):
         """
@@ -726,11 +1280,13 @@ class NSE:
         """
         url = f"{self.base_url}/equity-stockIndices"
 
-        return self.__req(url, params=dict(index=index)).json()
+        return jsonLoads(self.__req(url, params=dict(index=index)).content)
 
     def listIndices(self):
         """List all indices
 
+        Prices are live, so responses are reused for 2 seconds only. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listIndices.json>`__
 
         :return: A dictionary. The ``data`` key is a list of all Indices represented by a dictionary with the symbol code and other metadata.
@@ -738,7 +1294,7 @@ class NSE:
 
         url = f"{self.base_url}/allIndices"
 
-        return self.__req(url).json()
+        return jsonLoads(self.__cachedReq(url, ttl=2))
 
     def listIndexStocks(self, index):
         """
@@ -756,64 +1312,84 @@ class NSE:
         :return: A dictionary. The ``data`` key is a list of all stocks represented by a dictionary with the symbol code and other metadata.
         """
 
-        return self.__req(
-            f"{self.base_url}/equity-stockIndices",
-            params={"index": index.upper()},
-        ).json()
+        return jsonLoads(
+            self.__req(
+                f"{self.base_url}/equity-stockIndices",
+                params={"index": index.upper()},
+            ).content
+        )
 
     def listEtf(self):
         """List all etf stocks
 
+        Prices are live, so responses are reused for 2 seconds only. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listEtf.json>`__
 
         :return: A dictionary. The ``data`` key is a list of all ETF's represented by a dictionary with the symbol code and other metadata.
         """
 
-        return self.__req(f"{self.base_url}/etf").json()
+        return jsonLoads(self.__cachedReq(f"{self.base_url}/etf", ttl=2))
 
     def listSme(self):
         """List all sme stocks
 
+        Responses are reused for 5 minutes. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listSme.json>`__
 
         :return: A dictionary. The ``data`` key is a list of all SME's represented by a dictionary with the symbol code and other metadata.
         """
 
-        return self.__req(f"{self.base_url}/live-analysis-emerge").json()
+        return jsonLoads(
+            self.__cachedReq(f"{self.base_url}/live-analysis-emerge", ttl=300)
+        )
 
     def listSgb(self):
         """List all sovereign gold bonds
 
+        Responses are reused for 5 minutes. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listSgb.json>`__
 
         :return: A dictionary. The ``data`` key is a list of all SGB's represented by a dictionary with the symbol code and other metadata.
         """
 
-        return self.__req(f"{self.base_url}/sovereign-gold-bonds").json()
+        return jsonLoads(
+            self.__cachedReq(f"{self.base_url}/sovereign-gold-bonds", ttl=300)
+        )
 
     def listCurrentIPO(self) -> List[Dict]:
         """List current IPOs
 
+        Responses are reused for 10 minutes. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listCurrentIPO.json>`__
 
         :return: List of Dict containing current IPOs
         :rtype: List[Dict]
         """
 
-        return self.__req(f"{self.base_url}/ipo-current-issue").json()
+        return jsonLoads(
+            self.__cachedReq(f"{self.base_url}/ipo-current-issue", ttl=600)
+        )
 
     def listUpcomingIPO(self) -> List[Dict]:
         """List upcoming IPOs
 
+        Responses are reused for 10 minutes. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listUpcomingIPO.json>`__
 
         :return: List of Dict containing upcoming IPOs
         :rtype: List[Dict]
         """
 
-        return self.__req(
-            f"{self.base_url}/all-upcoming-issues?category=ipo"
-        ).json()
+        return jsonLoads(
+            self.__cachedReq(
+                f"{self.base_url}/all-upcoming-issues?category=ipo", ttl=600
+            )
+        )
 
     def listPastIPO(
         self,
@@ -822,6 +1398,8 @@ class NSE:
     ) -> List[Dict]:
         """List past IPOs
 
+        Responses for date ranges ending before today are cached on disk. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/listPastIPO.json>`__
 
         :param from_date: Optional defaults to 90 days from to_date
@@ -833,26 +1411,29 @@ class NSE:
         :rtype: List[Dict]
         """
 
+        now = datetime.now()
+
         if to_date is None:
-            to_date = datetime.now()
+            to_date = now
 
         if from_date is None:
-            from_date = to_date - timedelta(90)
+            from_date = to_date - pastIpoLookback
 
-        if to_date < from_date:
-            raise ValueError(
-                "Argument `to_date` cannot be less than `from_date`"
-            )
+        params = NSE.__dateRange(from_date, to_date)
 
-        params = dict(
-            from_date=from_date.strftime("%d-%m-%Y"),
-            to_date=to_date.strftime("%d-%m-%Y"),
-        )
+        url = f"{self.base_url}/public-past-issues"
 
-        return self.__req(
-            f"{self.base_url}/public-past-issues",
-            params=params,
-        ).json()
+        toDate = to_date.date() if isinstance(to_date, datetime) else to_date
+
+        if toDate < now.date():
+            # Past listings for a closed date range do not change
+            return jsonLoads(
+                self.__cachedReq(
+                    url, params=params, ttl=365 * 86400, persist=True
+                )
+            )
+
+        return jsonLoads(self.__req(url, params=params).content)
 
     def circulars(
         self,
@@ -907,22 +1488,16 @@ class NSE:
             to_date = datetime.now()
 
         if from_date is None:
-            from_date = to_date - timedelta(7)
-
-        if to_date < from_date:
-            raise ValueError(
-                "Argument `to_date` cannot be less than `from_date`"
-            )
+            from_date = to_date - circularsLookback
 
-        params = dict(
-            from_date=from_date.strftime("%d-%m-%Y"),
-            to_date=to_date.strftime("%d-%m-%Y"),
-        )
+        params = NSE.__dateRange(from_date, to_date)
 
         if dept_code:
             params["dept"] = dept_code.upper()
 
-        return self.__req(f"{self.base_url}/circulars", params=params).json()
+        return jsonLoads(
+            self.__req(f"{self.base_url}/circulars", params=params).content
+        )
 
     def blockDeals(self) -> Dict:
         """Block deals
@@ -932,11 +1507,13 @@ class NSE:
         :return: Block deals. ``data`` key is a list of all block deal (Empty list if no block deals).
         :rtype: dict"""
 
-        return self.__req(f"{self.base_url}/block-deal").json()
+        return jsonLoads(self.__req(f"{self.base_url}/block-deal").content)
 
     def fnoLots(self) -> Dict[str, int]:
         """Get the lot size of FnO stocks.
 
+        Responses are cached on disk for a day. See ``NSE.clear_cache``
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/fnoLots.json>`__
 
         :return: A dictionary with symbol code as keys and lot sizes for values
@@ -944,19 +1521,12 @@ class NSE:
 
         url = "https://nsearchives.nseindia.com/content/fo/fo_mktlots.csv"
 
-        res = self.__req(url).content
-
-        dct = {}
-
-        for line in res.strip().split(b"\n"):
-            _, sym, _, lot, *_ = line.split(b",")
+        res = self.__cachedReq(url, ttl=86400, persist=True)
 
-            try:
-                dct[sym.strip().decode()] = int(lot.strip().decode())
-            except ValueError:
-                continue
-
-        return dct
+        return {
+            m.group(1).decode(): int(m.group(2))
+            for m in lotRegex.finditer(res)
+        }
 
     def optionChain(
         self,
@@ -966,6 +1536,8 @@ class NSE:
     ) -> Dict:
         """Unprocessed option chain from NSE for Index futures or FNO stocks
 
+        The response is reused for 30 seconds, so repeated calls for the same ``symbol`` return the same snapshot.
+
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/optionChain.json>`__
 
         :param symbol: FnO stock or index futures code. For Index futures, must be one of ``banknifty``, ``nifty``, ``finnifty``, ``niftyit``
@@ -973,7 +1545,7 @@ class NSE:
         :return: Option chain for all expiries
         :rtype: dict"""
 
-        if symbol in self.__optionIndex:
+        if symbol.lower() in self.__optionIndex:
             url = f"{self.base_url}/option-chain-indices"
         else:
             url = f"{self.base_url}/option-chain-equities"
@@ -982,10 +1554,44 @@ class NSE:
             "symbol": symbol.upper(),
         }
 
-        data = self.__req(url, params=params).json()
+        # The response holds every expiry. Reuse it briefly so compiling
+        # several expiries for a symbol needs only one download
+        data = jsonLoads(self.__cachedReq(url, params=params, ttl=30))
 
         return data
 
+    @staticmethod
+    def __maxpainStrike(
+        strikes: List[float], ce_oi: List[int], pe_oi: List[int]
+    ) -> float:
+        """Return the strike price at which option writers lose the least.
+
+        Writer losses at each strike are computed from running sums of open
+        interest over the strikes sorted in ascending order, instead of
+        comparing every strike against every other strike."""
+
+        count = len(strikes)
+        order = sorted(range(count), key=strikes.__getitem__)
+        loss = [0] * count
+
+        # Loss to CE writers from every strike below the expiry strike
+        oi_sum = oi_val = 0
+
+        for i in order:
+            loss[i] += strikes[i] * oi_sum - oi_val
+            oi_sum += ce_oi[i]
+            oi_val += ce_oi[i] * strikes[i]
+
+        # Loss to PE writers from every strike above the expiry strike
+        oi_sum = oi_val = 0
+
+        for i in reversed(order):
+            loss[i] += oi_val - strikes[i] * oi_sum
+            oi_sum += pe_oi[i]
+            oi_val += pe_oi[i] * strikes[i]
+
+        return strikes[min(range(count), key=loss.__getitem__)]
+
     @staticmethod
     def maxpain(optionChain: Dict, expiryDate: datetime) -> float:
         """Get the max pain strike price
@@ -997,34 +1603,21 @@ class NSE:
         :return: max pain strike price
         :rtype: float"""
 
-        out = {}
+        strikes = []
+        ce_oi = []
+        pe_oi = []
 
-        expiryDateStr = expiryDate.strftime("%d-%b-%Y")
+        expiryDateStr = NSE.__dMonY(expiryDate)
 
         for x in optionChain["records"]["data"]:
             if x["expiryDate"] != expiryDateStr:
                 continue
 
-            expiryStrike = x["strikePrice"]
-            pain = 0
+            strikes.append(x["strikePrice"])
+            ce_oi.append(x["CE"]["openInterest"] if "CE" in x else 0)
+            pe_oi.append(x["PE"]["openInterest"] if "PE" in x else 0)
 
-            for y in optionChain["records"]["data"]:
-                if y["expiryDate"] != expiryDateStr:
-                    continue
-
-                diff = expiryStrike - y["strikePrice"]
-
-                # strike expiry above strike, loss for CE writers
-                if diff > 0 and "CE" in y:
-                    pain += -diff * y["CE"]["openInterest"]
-
-                # strike expiry below strike, loss for PE writers
-                if diff < 0 and "PE" in y:
-                    pain += diff * y["PE"]["openInterest"]
-
-            out[expiryStrike] = pain
-
-        return max(out.keys(), key=(lambda k: out[k]))
+        return NSE.__maxpainStrike(strikes, ce_oi, pe_oi)
 
     def getFuturesExpiry(
         self, index: Literal["nifty", "banknifty", "finnifty"] = "nifty"
@@ -1051,14 +1644,18 @@ class NSE:
         else:
             idx = "nse50_fut"
 
-        res: Dict = self.__req(
-            f"{self.base_url}/liveEquity-derivatives",
-            params={"index": idx},
-        ).json()
+        res: Dict = jsonLoads(
+            self.__req(
+                f"{self.base_url}/liveEquity-derivatives",
+                params={"index": idx},
+            ).content
+        )
 
         data = tuple(i["expiryDate"] for i in res["data"])
 
-        return sorted(data, key=lambda x: datetime.strptime(x, "%d-%b-%Y"))
+        # Dates are formatted as dd-Mon-yyyy. Sort on (year, month, day)
+        # sliced from the string instead of parsing each with strptime
+        return sorted(data, key=lambda x: (x[7:], months[x[3:6]], x[:2]))
 
     def compileOptionChain(
         self,
@@ -1093,7 +1690,7 @@ class NSE:
         chain = {}
         oc = {}
 
-        expiryDateStr = expiryDate.strftime("%d-%b-%Y")
+        expiryDateStr = NSE.__dMonY(expiryDate)
 
         oc["expiry"] = expiryDateStr
         oc["timestamp"] = data["records"]["timestamp"]
@@ -1108,8 +1705,11 @@ class NSE:
 
         maxCoi = maxPoi = totalCoi = totalPoi = maxCoiStrike = maxPoiStrike = 0
 
-        dataFields = ("openInterest", "lastPrice", "chg", "impliedVolatility")
-        ocFields = ("last", "oi", "chg", "iv")
+        strikes = []
+        ce_oi = []
+        pe_oi = []
+
+        emptySide = {"last": 0, "oi": 0, "chg": 0, "iv": 0}
 
         for idx in data["records"]["data"]:
             if idx["expiryDate"] != expiryDateStr:
@@ -1117,17 +1717,18 @@ class NSE:
 
             strike = str(idx["strikePrice"])
 
-            if strike not in chain:
-                chain[strike] = {"pe": {}, "ce": {}}
-
             poi = coi = 0
 
             if "PE" in idx:
-                poi, last, chg, iv = map(idx["PE"].get, dataFields)
-
-                chain[strike]["pe"].update(
-                    {"last": last, "oi": poi, "chg": chg, "iv": iv}
-                )
+                pe = idx["PE"]
+                poi = pe["openInterest"]
+
+                pe = {
+                    "last": pe["lastPrice"],
+                    "oi": poi,
+                    "chg": pe.get("chg"),
+                    "iv": pe["impliedVolatility"],
+                }
 
                 totalPoi += poi
 
@@ -1135,15 +1736,18 @@ class NSE:
                     maxPoi = poi
                     maxPoiStrike = int(strike)
             else:
-                for f in ocFields:
-                    chain[strike]["pe"][f] = 0
+                pe = emptySide.copy()
 
             if "CE" in idx:
-                coi, last, chg, iv = map(idx["CE"].get, dataFields)
-
-                chain[strike]["ce"].update(
-                    {"last": last, "oi": poi, "chg": chg, "iv": iv}
-                )
+                ce = idx["CE"]
+                coi = ce["openInterest"]
+
+                ce = {
+                    "last": ce["lastPrice"],
+                    "oi": coi,
+                    "chg": ce.get("chg"),
+                    "iv": ce["impliedVolatility"],
+                }
 
                 totalCoi += coi
 
@@ -1151,17 +1755,22 @@ class NSE:
                     maxCoi = coi
                     maxCoiStrike = int(strike)
             else:
-                for f in ocFields:
-                    chain[strike]["ce"][f] = 0
+                ce = emptySide.copy()
 
-            if poi == 0 or coi == 0:
-                chain[strike]["pcr"] = None
-            else:
-                chain[strike]["pcr"] = round(poi / coi, 2)
+            # Strikes are unique within an expiry, build each entry once
+            chain[strike] = {
+                "pe": pe,
+                "ce": ce,
+                "pcr": None if poi == 0 or coi == 0 else round(poi / coi, 2),
+            }
+
+            strikes.append(idx["strikePrice"])
+            ce_oi.append(coi)
+            pe_oi.append(poi)
 
         oc.update(
             {
-                "maxpain": self.maxpain(data, expiryDate),
+                "maxpain": NSE.__maxpainStrike(strikes, ce_oi, pe_oi),
                 "maxCoi": maxCoiStrike,
                 "maxPoi": maxPoiStrike,
                 "coiTotal": totalCoi,
@@ -1185,13 +1794,15 @@ class NSE:
             "https://www1.nseindia.com/common/json/indicesAdvanceDeclines.json"
         )
 
-        return self.__req(url).json()["data"]
+        return jsonLoads(self.__req(url).content)["data"]
 
     def holidays(
         self, type: Literal["trading", "clearing"] = "trading"
     ) -> Dict[str, List[Dict]]:
         """NSE holiday list
 
+        Responses are cached on disk for a day. See ``NSE.clear_cache``
+
         ``CM`` key in dictionary stands for Capital markets (Equity Market).
 
         `Sample response <https://github.com/BennyThadikaran/NseIndiaApi/blob/main/src/samples/holidays.json>`__
@@ -1203,7 +1814,12 @@ class NSE:
 
         url = f"{self.base_url}/holiday-master"
 
-        data = self.__req(url, params={"type": type}).json()
+        # Holiday lists are published for the year, keep them for a day
+        data = jsonLoads(
+            self.__cachedReq(
+                url, params={"type": type}, ttl=86400, persist=True
+            )
+        )
 
         return data
 
@@ -1227,11 +1843,11 @@ class NSE:
 
         url = "{}/historical/bulk-deals?from={}&to={}".format(
             self.base_url,
-            fromdate.strftime("%d-%m-%Y"),
-            todate.strftime("%d-%m-%Y"),
+            NSE.__dmy(fromdate, "-"),
+            NSE.__dmy(todate, "-"),
         )
 
-        data = self.__req(url).json()
+        data = jsonLoads(self.__req(url).content)
 
         if not "data" in data or len(data["data"]) < 1:
             raise RuntimeError(
@@ -0,0 +1,87 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Union
+
+from .NSE import NSE
+
+
+class NSEAsync:
+    """An asyncio interface to the NSE India API.
+
+    Every public method of :class:`NSE` is available as a coroutine with the same arguments. Calls run on a thread pool and share one pooled ``requests`` session, so requests for many symbols can be awaited together with ``asyncio.gather``.
+
+    Requests are still throttled to 3 requests per second.
+
+    :param download_folder: A folder/dir to save downloaded files and cookie files
+    :type download_folder: pathlib.Path or str
+    :param max_workers: Maximum number of requests in flight. Default 8
+    :type max_workers: int
+    :param kwargs: Other keyword arguments passed on to :class:`NSE`
+    :raise ValueError: if ``download_folder`` is not a folder/dir
+    """
+
+    def __init__(
+        self,
+        download_folder: Union[str, Path],
+        max_workers: int = 8,
+        **kwargs,
+    ):
+        """Initialise NSEAsync"""
+
+        self.shared = kwargs.get("share_session", False)
+        self.nse = NSE(download_folder, **kwargs)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __getattr__(self, name: str):
+        if name in ("nse", "executor", "shared"):
+            # Not yet set during __init__
+            raise AttributeError(name)
+
+        attr = getattr(self.nse, name)
+
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        async def method(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+
+            return await loop.run_in_executor(
+                self.executor, partial(attr, *args, **kwargs)
+            )
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+
+        return method
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, *_):
+        await self.__shutdown()
+
+        # Keep a shared session open for the next instance using this
+        # folder, unless the block failed
+        if exc_type is not None or not self.shared:
+            self.nse.exit()
+
+        return False
+
+    async def __shutdown(self):
+        # Wait for in-flight requests off the event loop thread, so other
+        # tasks keep running meanwhile
+        loop = asyncio.get_running_loop()
+
+        await loop.run_in_executor(
+            None, partial(self.executor.shutdown, wait=True)
+        )
+
+    async def exit(self):
+        """Close the ``requests`` session and shutdown the thread pool.
+
+        *Not required when using the ``async with`` statement.* With ``share_session=True``, the ``async with`` statement keeps the session open for reuse by other ``NSE`` instances with the same ``download_folder``."""
+
+        await self.__shutdown()
+        self.nse.exit()
@@ -1 +1,2 @@
 from .NSE import NSE
+from .NSEAsync import NSEAsync